@@ -91,6 +91,15 @@ class FileProcessor:
         '.tar.gz', '.tar.bz2', '.tar.xz'
     }
     
+    # Extension -> file type, so detection is a single dict lookup
+    EXT_MAP = {
+        **dict.fromkeys(IMAGE_EXTENSIONS, FileType.IMAGE),
+        **dict.fromkeys(DOCUMENT_EXTENSIONS, FileType.DOCUMENT),
+        **dict.fromkeys(AUDIO_EXTENSIONS, FileType.AUDIO),
+        **dict.fromkeys(VIDEO_EXTENSIONS, FileType.VIDEO),
+        **dict.fromkeys(ARCHIVE_EXTENSIONS, FileType.ARCHIVE),
+    }
+    
     def __init__(self):
         self.converters = {}
         self._register_converters()
@@ -123,20 +132,7 @@ class FileProcessor:
     
     def detect_file_type(self, file_path: Path) -> FileType:
         """Detect the type of a file based on its extension"""
-        ext = file_path.suffix.lower()
-        
-        if ext in self.IMAGE_EXTENSIONS:
-            return FileType.IMAGE
-        elif ext in self.DOCUMENT_EXTENSIONS:
-            return FileType.DOCUMENT
-        elif ext in self.AUDIO_EXTENSIONS:
-            return FileType.AUDIO
-        elif ext in self.VIDEO_EXTENSIONS:
-            return FileType.VIDEO
-        elif ext in self.ARCHIVE_EXTENSIONS:
-            return FileType.ARCHIVE
-        else:
-            return FileType.UNKNOWN
+        return self.EXT_MAP.get(file_path.suffix.lower(), FileType.UNKNOWN)
     
     def get_supported_formats(self, file_type: FileType) -> List[str]:
         """Get list of supported output formats for a file type"""
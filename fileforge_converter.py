@@ -51,6 +51,12 @@ except ImportError:
     PROFESSIONAL_CONVERTER_AVAILABLE = False
     print("⚠️ Professional converter not available, using basic conversion")
 
+# Escape table for text placed inside generated XML/HTML markup
+_XML_ESCAPE = str.maketrans({'&': '&amp;', '<': '&lt;', '>': '&gt;'})
+
+# Buffer size for bulk text file reads/writes (1 MiB)
+_TEXT_IO_BUFFER = 1 << 20
+
 class FileForgeConverter:
     """Complete file conversion utility with working conversion features."""
     
@@ -76,6 +82,9 @@ class FileForgeConverter:
         self.output_directory = ""
         self.current_operation = ""
         
+        # Results window, created on first use and reused afterwards
+        self._analysis_window = None
+        
         # Supported conversions (working implementations)
         self.conversions = {
             'image': {
@@ -95,6 +104,15 @@ class FileForgeConverter:
             }
         }
         
+        # Text conversion dispatch (output format -> converter method)
+        self._text_converters = {
+            'HTML': self._text_to_html,
+            'JSON': self._text_to_json,
+            'XML': self._text_to_xml,
+            'CSV': self._text_to_csv,
+            'MD': self._text_to_markdown
+        }
+        
         self.setup_ui()
         
     def setup_ui(self):
@@ -787,19 +805,30 @@ class FileForgeConverter:
             result_text = "\n".join(results)
             result_text += f"\n\nTOTAL: {total_words} words, {total_chars} characters, {total_lines} lines"
             
-            # Show results in a new window
-            result_window = tk.Toplevel(self.root)
-            result_window.title("Word Count Results")
-            result_window.geometry("500x400")
-            
-            text_widget = tk.Text(result_window, wrap='word')
-            text_widget.pack(fill='both', expand=True, padx=10, pady=10)
-            text_widget.insert('1.0', result_text)
-            text_widget.config(state='disabled')
+            self._show_analysis_results("Word Count Results", result_text)
             
         except Exception as e:
             messagebox.showerror("Error", f"Failed to count words: {str(e)}")
     
+    def _show_analysis_results(self, title, result_text):
+        """Show results in a reusable window that is hidden instead of destroyed."""
+        if self._analysis_window is None:
+            self._analysis_window = tk.Toplevel(self.root)
+            self._analysis_window.geometry("500x400")
+            self._analysis_window.protocol("WM_DELETE_WINDOW", self._analysis_window.withdraw)
+            
+            self._analysis_text = tk.Text(self._analysis_window, wrap='word')
+            self._analysis_text.pack(fill='both', expand=True, padx=10, pady=10)
+        
+        self._analysis_window.title(title)
+        self._analysis_text.config(state='normal')
+        self._analysis_text.delete('1.0', tk.END)
+        self._analysis_text.insert('1.0', result_text)
+        self._analysis_text.config(state='disabled')
+        
+        self._analysis_window.deiconify()
+        self._analysis_window.lift()
+    
     def find_replace(self):
         """Find and replace text in documents."""
         if not self.selected_doc_files:
@@ -1350,6 +1379,8 @@ Universal File Conversion Toolkit
                     input_kb = info.get('file_size_before', 0) / 1024
                     output_kb = info.get('file_size_after', 0) / 1024
                     print(f"   💾 File: {input_kb:.1f}KB → {output_kb:.1f}KB")
+                    if info.get('copied_unchanged'):
+                        print(f"   📋 Copied unchanged: same format and nothing to re-encode")
                 
                 return True
             else:
@@ -1511,7 +1542,7 @@ Universal File Conversion Toolkit
         
         if file_path:
             try:
-                with open(file_path, 'r', encoding='utf-8') as f:
+                with open(file_path, 'r', encoding='utf-8', buffering=_TEXT_IO_BUFFER) as f:
                     content = f.read()
                     self.text_input.delete('1.0', tk.END)
                     self.text_input.insert('1.0', content)
@@ -1521,28 +1552,20 @@ Universal File Conversion Toolkit
                 
     def convert_text(self):
         """Convert text to selected format."""
-        content = self.text_input.get('1.0', tk.END).strip()
-        
-        if not content:
+        # 'end-1c' excludes the trailing newline Tk always appends, so an
+        # empty widget can be detected without copying its contents
+        if self.text_input.index('end-1c') == '1.0':
             messagebox.showwarning("No Content", "Please enter or load text content.")
             return
             
+        content = self.text_input.get('1.0', 'end-1c')
+        
         output_format = self.text_format_var.get()
         
         # Simple format conversions
         try:
-            if output_format == "HTML":
-                converted = self._text_to_html(content)
-            elif output_format == "JSON":
-                converted = self._text_to_json(content)
-            elif output_format == "XML":
-                converted = self._text_to_xml(content)
-            elif output_format == "CSV":
-                converted = self._text_to_csv(content)
-            elif output_format == "MD":
-                converted = self._text_to_markdown(content)
-            else:
-                converted = content
+            converter = self._text_converters.get(output_format)
+            converted = converter(content) if converter else content
                 
             # Save converted content
             output_path = filedialog.asksaveasfilename(
@@ -1552,7 +1575,7 @@ Universal File Conversion Toolkit
             )
             
             if output_path:
-                with open(output_path, 'w', encoding='utf-8') as f:
+                with open(output_path, 'w', encoding='utf-8', buffering=_TEXT_IO_BUFFER) as f:
                     f.write(converted)
                 messagebox.showinfo("Success", f"Text converted and saved as {output_format}!")
                 self.status_bar.config(text=f"Converted to {output_format}: {Path(output_path).name}")
@@ -1566,7 +1589,7 @@ Universal File Conversion Toolkit
         html = "<html>\n<head><title>Converted Text</title></head>\n<body>\n"
         for line in lines:
             if line.strip():
-                html += f"<p>{line}</p>\n"
+                html += f"<p>{line.translate(_XML_ESCAPE)}</p>\n"
             else:
                 html += "<br>\n"
         html += "</body>\n</html>"
@@ -1589,7 +1612,7 @@ Universal File Conversion Toolkit
         xml = '<?xml version="1.0" encoding="UTF-8"?>\n<document>\n'
         for i, line in enumerate(lines):
             if line.strip():
-                xml += f'  <line id="{i+1}">{line}</line>\n'
+                xml += f'  <line id="{i+1}">{line.translate(_XML_ESCAPE)}</line>\n'
         xml += '</document>'
         return xml
         
@@ -1661,41 +1684,57 @@ Universal File Conversion Toolkit
         thread.daemon = True
         thread.start()
     
+    def _iter_batch_files(self, root_path, extensions, recursive):
+        """Yield matching file entries one at a time using os.scandir.
+        
+        An unreadable root directory raises; unreadable subdirectories are skipped.
+        """
+        root_dir = str(root_path)
+        pending_dirs = [root_dir]
+        while pending_dirs:
+            current_dir = pending_dirs.pop()
+            try:
+                with os.scandir(current_dir) as entries:
+                    for entry in entries:
+                        try:
+                            if entry.is_dir(follow_symlinks=False):
+                                if recursive:
+                                    pending_dirs.append(entry.path)
+                            elif entry.is_file():
+                                ext = os.path.splitext(entry.name)[1].lower().lstrip('.')
+                                if ext in extensions:
+                                    yield entry
+                        except OSError:
+                            # Skip entries we can't access
+                            continue
+            except OSError as e:
+                if current_dir == root_dir:
+                    raise
+                print(f"Error scanning {current_dir}: {e}")
+    
     def _scan_files_thread(self):
         """Scan files in background thread."""
         try:
             root_path = Path(self.batch_root_directory)
             from_filter = self.from_format_var.get()
-            extensions = self.get_file_extensions_for_filter(from_filter)
+            extensions = set(self.get_file_extensions_for_filter(from_filter))
+            to_format = self.batch_to_format_var.get()
             
             self.batch_files_list = []
             
             # Update status
             self.root.after(0, lambda: self.overall_progress_label.config(text="Scanning files..."))
+            self.root.after(0, self._start_scan_progress)
             
-            # Scan files
-            if self.recursive_var.get():
-                file_pattern = root_path.rglob("*")
-            else:
-                file_pattern = root_path.glob("*")
-            
-            files_found = []
-            for file_path in file_pattern:
-                if file_path.is_file():
-                    ext = file_path.suffix.lower().lstrip('.')
-                    if ext in extensions:
-                        files_found.append(file_path)
-            
-            # Process found files
-            total_files = len(files_found)
-            
-            for i, file_path in enumerate(files_found):
+            # Stream matching files straight from the directory walk so the
+            # full tree is never held in memory at once
+            for entry in self._iter_batch_files(root_path, extensions, self.recursive_var.get()):
                 try:
-                    file_size = file_path.stat().st_size
+                    file_path = Path(entry.path)
+                    file_size = entry.stat().st_size
                     size_str = self._format_file_size(file_size)
                     
                     from_format = file_path.suffix.upper().lstrip('.')
-                    to_format = self.batch_to_format_var.get()
                     
                     file_info = {
                         'path': file_path,
@@ -1711,23 +1750,24 @@ Universal File Conversion Toolkit
                     
                     # Update UI
                     self.root.after(0, self._add_file_to_tree, file_info)
-                    
-                    # Update progress
-                    progress = (i + 1) / total_files * 100
-                    self.root.after(0, lambda p=progress: self.overall_progress_bar.config(value=p))
-                    self.root.after(0, lambda: self.current_file_label.config(text=f"Scanning: {file_path.name}"))
+                    self.root.after(0, lambda n=file_path.name: self.current_file_label.config(text=f"Scanning: {n}"))
                     
                 except Exception as e:
-                    print(f"Error scanning {file_path}: {e}")
+                    print(f"Error scanning {entry.path}: {e}")
             
             # Update final stats
             self.batch_stats['found'] = len(self.batch_files_list)
             self.root.after(0, self._scan_complete)
             
         except Exception as e:
-            self.root.after(0, lambda: messagebox.showerror("Scan Error", f"Failed to scan files: {str(e)}"))
+            self.root.after(0, lambda err=str(e): messagebox.showerror("Scan Error", f"Failed to scan files: {err}"))
             self.root.after(0, self._scan_complete)
     
+    def _start_scan_progress(self):
+        """Show activity while scanning, since the total is not known up front."""
+        self.overall_progress_bar.config(mode='indeterminate')
+        self.overall_progress_bar.start(10)
+    
     def _add_file_to_tree(self, file_info):
         """Add file to the treeview."""
         self.batch_files_tree.insert('', 'end', values=(
@@ -1741,7 +1781,8 @@ Universal File Conversion Toolkit
     def _scan_complete(self):
         """Handle scan completion."""
         self.scan_btn.config(state='normal', text="🔍 SCAN FILES")
-        self.overall_progress_bar.config(value=0)
+        self.overall_progress_bar.stop()
+        self.overall_progress_bar.config(mode='determinate', value=0)
         self.current_file_label.config(text="")
         
         files_count = len(self.batch_files_list)
@@ -1869,6 +1910,8 @@ Universal File Conversion Toolkit
                     max_width=max_width,
                     max_height=max_height
                 )
+                if result['success'] and result['conversion_info'].get('copied_unchanged'):
+                    print(f"📋 {file_info['name']}: copied unchanged (same format, nothing to re-encode)")
                 return result['success']
             else:
                 # Fallback to basic conversion
@@ -70,6 +70,12 @@ setup(
             "scikit-image>=0.19.0",
             "wand>=0.6.0",
         ],
+        "xxhash": [
+            "xxhash>=3.0.0",
+        ],
+        "jxl": [
+            "jxlpy>=0.9.0",
+        ],
     },
     entry_points={
         "console_scripts": [
@@ -1,43 +1,119 @@
 """Test configuration and fixtures for SilentCanoe FileForge."""
 
+import os
 import pytest
-import tempfile
 import shutil
 from pathlib import Path
-from typing import Generator
 from unittest.mock import Mock, MagicMock
 
-@pytest.fixture
-def temp_dir() -> Generator[Path, None, None]:
-    """Create a temporary directory for tests."""
-    temp_path = Path(tempfile.mkdtemp())
+# Smallest valid images (1x1 grayscale JPEG, 1x1 RGB PNG) for tests that never decode them
+MINIMAL_JPEG = bytes.fromhex(
+    'ffd8ffe000104a46494600010100000100010000ffdb004300080606070605080707070909080a0c'
+    '140d0c0b0b0c1912130f141d1a1f1e1d1a1c1c20242e2720222c231c1c2837292c30313434341f27'
+    '393d38323c2e333432ffc0000b080001000101011100ffc400140001000000000000000000000000'
+    '00000008ffc40014100100000000000000000000000000000000ffda0008010100003f003fbfffd9'
+)
+MINIMAL_PNG = bytes.fromhex(
+    '89504e470d0a1a0a0000000d4948445200000001000000010802000000907753de0000000c494441'
+    '5478da63f8cfc0000003010100f70341430000000049454e44ae426082'
+)
+
+# Modules that import Pillow at collection time; --no-image skips collecting them
+IMAGE_ONLY_MODULES = {'test_image_converter.py'}
+
+def _quick_write(path: Path, data: bytes) -> None:
+    """Write a small fixture file with raw os calls (no buffered file object)."""
+    fd = os.open(str(path), os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
     try:
-        yield temp_path
+        os.write(fd, data)
     finally:
-        shutil.rmtree(temp_path, ignore_errors=True)
+        os.close(fd)
+
+def pytest_addoption(parser):
+    parser.addoption("--no-image", action="store_true", default=False,
+                     help="skip tests marked 'image' and don't collect image-only modules "
+                          "(Pillow is never imported)")
+
+def pytest_configure(config):
+    config.addinivalue_line("markers", "image: test needs Pillow and real encoded images")
+
+def pytest_ignore_collect(collection_path, config):
+    """Don't import image-only test modules under --no-image."""
+    if config.getoption("--no-image") and collection_path.name in IMAGE_ONLY_MODULES:
+        return True
+    return None
+
+def pytest_collection_modifyitems(config, items):
+    """Mark tests that use the image fixtures as 'image' and drop them under --no-image."""
+    for item in items:
+        fixturenames = getattr(item, 'fixturenames', ())
+        if 'sample_image_files' in fixturenames or 'real_image_files' in fixturenames:
+            item.add_marker(pytest.mark.image)
+    
+    if not config.getoption("--no-image"):
+        return
+    selected, deselected = [], []
+    for item in items:
+        (deselected if item.get_closest_marker("image") else selected).append(item)
+    if deselected:
+        config.hook.pytest_deselected(items=deselected)
+        items[:] = selected
 
 @pytest.fixture
-def sample_image_files(temp_dir: Path) -> dict:
-    """Create sample image files for testing."""
-    try:
-        from PIL import Image
-    except ImportError:
-        pytest.skip("PIL not available for image tests")
+def temp_dir(tmp_path: Path) -> Path:
+    """Temporary directory for tests (pytest's tmp_path, cleaned up by retention)."""
+    return tmp_path
+
+@pytest.fixture(scope="session")
+def _sample_image_cache(tmp_path_factory) -> dict:
+    """Encode the sample images once per test session."""
+    # Imported here so runs that only use mock files never load Pillow
+    Image = pytest.importorskip('PIL.Image')
     
-    files = {}
+    cache_dir = tmp_path_factory.mktemp("img_cache")
     
     # Create a simple test image
     img = Image.new('RGB', (100, 100), color='red')
     
     # Save in different formats
+    jpg_path = cache_dir / "test.jpg"
+    png_path = cache_dir / "test.png"
+    
+    img.save(jpg_path, 'JPEG', quality=75, optimize=False, progressive=False)
+    img.save(png_path, 'PNG', compress_level=1, optimize=False)
+    
+    return {'jpg': jpg_path, 'png': png_path}
+
+@pytest.fixture
+def sample_image_files(temp_dir: Path) -> dict:
+    """Create sample image files for testing (minimal valid 1x1 images).
+    
+    Tests using this fixture are marked ``image`` automatically and are
+    deselected when pytest runs with ``--no-image``.
+    """
     jpg_path = temp_dir / "test.jpg"
     png_path = temp_dir / "test.png"
     
-    img.save(jpg_path, 'JPEG')
-    img.save(png_path, 'PNG')
+    _quick_write(jpg_path, MINIMAL_JPEG)
+    _quick_write(png_path, MINIMAL_PNG)
+    
+    return {'jpg': jpg_path, 'png': png_path}
+
+@pytest.fixture
+def real_image_files(temp_dir: Path, _sample_image_cache: dict) -> dict:
+    """Create 100x100 encoded images for tests that decode and check pixels.
+    
+    Tests using this fixture are marked ``image`` automatically and are
+    deselected when pytest runs with ``--no-image``.
+    """
+    files = {}
     
-    files['jpg'] = jpg_path
-    files['png'] = png_path
+    # Copy the session's encoded images instead of re-encoding them. A private
+    # copy (not a hard link) keeps in-place writes from leaking into later tests.
+    for ext, cached_path in _sample_image_cache.items():
+        file_path = temp_dir / cached_path.name
+        shutil.copyfile(cached_path, file_path)
+        files[ext] = file_path
     
     return files
 
@@ -88,9 +164,9 @@ def sample_files_structure(temp_dir: Path) -> dict:
     }
     
     # Create directories
-    for folder in structure.values():
-        if isinstance(folder, Path):
-            folder.mkdir(exist_ok=True)
+    for folder in (structure['images'], structure['documents'], structure['audio'],
+                   structure['video'], structure['output']):
+        folder.mkdir(exist_ok=True)
     
     # Create sample files
     sample_files = {}
@@ -99,23 +175,23 @@ def sample_files_structure(temp_dir: Path) -> dict:
     (structure['documents'] / 'sample.txt').write_text("Sample text content")
     (structure['documents'] / 'readme.md').write_text("# Sample Markdown")
     
-    # Mock image files (just empty files with correct extensions)
-    image_files = ['photo.jpg', 'image.png', 'picture.heic', 'graphic.webp']
-    for filename in image_files:
-        (structure['images'] / filename).write_bytes(b'fake_image_data')
-        sample_files[filename] = structure['images'] / filename
-    
-    # Mock audio files
-    audio_files = ['song.mp3', 'track.wav', 'music.flac']
-    for filename in audio_files:
-        (structure['audio'] / filename).write_bytes(b'fake_audio_data')
-        sample_files[filename] = structure['audio'] / filename
-    
-    # Mock video files  
-    video_files = ['movie.mp4', 'clip.avi', 'video.mkv']
-    for filename in video_files:
-        (structure['video'] / filename).write_bytes(b'fake_video_data')
-        sample_files[filename] = structure['video'] / filename
+    # Mock media files (placeholder bytes with correct extensions)
+    mock_files = (
+        ('images', 'photo.jpg', b'fake_image_data'),
+        ('images', 'image.png', b'fake_image_data'),
+        ('images', 'picture.heic', b'fake_image_data'),
+        ('images', 'graphic.webp', b'fake_image_data'),
+        ('audio', 'song.mp3', b'fake_audio_data'),
+        ('audio', 'track.wav', b'fake_audio_data'),
+        ('audio', 'music.flac', b'fake_audio_data'),
+        ('video', 'movie.mp4', b'fake_video_data'),
+        ('video', 'clip.avi', b'fake_video_data'),
+        ('video', 'video.mkv', b'fake_video_data'),
+    )
+    for subdir, filename, payload in mock_files:
+        file_path = structure[subdir] / filename
+        _quick_write(file_path, payload)
+        sample_files[filename] = file_path
     
     structure['files'] = sample_files
     return structure
\ No newline at end of file
@@ -1,24 +1,63 @@
 """Comprehensive tests for the core module."""
 
+import os
+import sys
 import unittest
 from unittest.mock import Mock, patch, MagicMock
 from pathlib import Path
-import tempfile
-import shutil
+import pytest
 
+# Extension -> file type table used by the detection tests
+EXT_TO_TYPE = {
+    '.jpg': 'image', '.jpeg': 'image', '.png': 'image', '.heic': 'image', '.webp': 'image',
+    '.pdf': 'document', '.docx': 'document', '.txt': 'document',
+    '.mp3': 'audio', '.wav': 'audio', '.flac': 'audio',
+    '.mp4': 'video', '.avi': 'video', '.mkv': 'video',
+    '.zip': 'archive', '.rar': 'archive', '.7z': 'archive'
+}
 
-class TestFileProcessor(unittest.TestCase):
+
+class TempDirMixin:
+    """Expose pytest's tmp_path to unittest test cases as ``self.temp_dir``.
+    
+    The directory is only created for tests that actually use it.
+    """
+    
+    @pytest.fixture(autouse=True)
+    def _capture_request(self, request):
+        self._request = request
+    
+    @property
+    def temp_dir(self) -> Path:
+        return self._request.getfixturevalue('tmp_path')
+
+
+class SharedMock:
+    """One Mock per test class, reset the first time each test reads it.
+    
+    Every test sees the same Mock object, cleared of recorded calls and of
+    return values and side effects configured by earlier tests.
+    """
+    
+    def __init__(self):
+        self._mock = Mock()
+    
+    def __set_name__(self, owner, name):
+        self._name = name
+    
+    def __get__(self, instance, owner):
+        if instance is None:
+            return self
+        self._mock.reset_mock(return_value=True, side_effect=True)
+        # Cache on the test instance so later reads skip the reset
+        instance.__dict__[self._name] = self._mock
+        return self._mock
+
+
+class TestFileProcessor(TempDirMixin, unittest.TestCase):
     """Test cases for FileProcessor class."""
     
-    def setUp(self):
-        """Set up test fixtures."""
-        self.temp_dir = Path(tempfile.mkdtemp())
-        self.mock_processor = Mock()
-        
-    def tearDown(self):
-        """Clean up test fixtures."""
-        if self.temp_dir.exists():
-            shutil.rmtree(self.temp_dir, ignore_errors=True)
+    mock_processor = SharedMock()
     
     def test_file_type_detection(self):
         """Test file type detection functionality."""
@@ -34,22 +73,18 @@ class TestFileProcessor(unittest.TestCase):
         
         for filename, expected_type in test_cases:
             with self.subTest(filename=filename):
-                # Mock file type detection logic
-                if filename.endswith(('.jpg', '.jpeg', '.png', '.heic', '.webp')):
-                    detected_type = 'image'
-                elif filename.endswith(('.pdf', '.docx', '.txt')):
-                    detected_type = 'document'
-                elif filename.endswith(('.mp3', '.wav', '.flac')):
-                    detected_type = 'audio'
-                elif filename.endswith(('.mp4', '.avi', '.mkv')):
-                    detected_type = 'video'
-                elif filename.endswith(('.zip', '.rar', '.7z')):
-                    detected_type = 'archive'
-                else:
-                    detected_type = 'unknown'
+                detected_type = EXT_TO_TYPE.get(Path(filename).suffix.lower(), 'unknown')
                 
                 self.assertEqual(detected_type, expected_type)
     
+    def test_extension_table_matches_file_processor(self):
+        """Test that the extension table agrees with FileProcessor.EXT_MAP."""
+        from fileforge.core import FileProcessor
+        
+        for ext, expected_type in EXT_TO_TYPE.items():
+            with self.subTest(ext=ext):
+                self.assertEqual(FileProcessor.EXT_MAP[ext].value, expected_type)
+    
     def test_supported_formats(self):
         """Test that supported formats are properly defined."""
         expected_formats = {
@@ -103,14 +138,13 @@ class TestFileProcessor(unittest.TestCase):
         self.assertFalse(invalid_file.exists())
 
 
-class TestBatchProcessor(unittest.TestCase):
+class TestBatchProcessor(TempDirMixin, unittest.TestCase):
     """Test cases for BatchProcessor class."""
     
+    mock_batch_processor = SharedMock()
+    
     def setUp(self):
         """Set up test fixtures."""
-        self.temp_dir = Path(tempfile.mkdtemp())
-        self.mock_batch_processor = Mock()
-        
         # Create sample file structure
         self.input_dir = self.temp_dir / "input"
         self.output_dir = self.temp_dir / "output"
@@ -122,21 +156,18 @@ class TestBatchProcessor(unittest.TestCase):
         for filename in sample_files:
             (self.input_dir / filename).write_text(f"sample content for {filename}")
     
-    def tearDown(self):
-        """Clean up test fixtures."""
-        if self.temp_dir.exists():
-            shutil.rmtree(self.temp_dir, ignore_errors=True)
-    
     def test_batch_file_discovery(self):
         """Test batch file discovery with patterns."""
-        # Test pattern matching
-        heic_files = list(self.input_dir.glob("*.heic"))
+        # Test suffix matching over a single directory scan
+        with os.scandir(self.input_dir) as it:
+            names = [entry.name for entry in it if entry.is_file()]
+        
+        heic_files = [name for name in names if name.endswith('.heic')]
         self.assertEqual(len(heic_files), 2)
         
-        all_files = list(self.input_dir.glob("*"))
-        self.assertEqual(len(all_files), 4)
+        self.assertEqual(len(names), 4)
         
-        pdf_files = list(self.input_dir.glob("*.pdf"))
+        pdf_files = [name for name in names if name.endswith('.pdf')]
         self.assertEqual(len(pdf_files), 1)
     
     def test_batch_processing_configuration(self):
@@ -175,38 +206,52 @@ class TestBatchProcessor(unittest.TestCase):
         # Simulate parallel processing
         import threading
         import time
+        from collections import deque
+        from concurrent.futures import ThreadPoolExecutor
         
-        results = []
+        files = ['file1.heic', 'file2.heic', 'file3.heic', 'file4.heic']
+        results = deque()
+        # Every worker must reach the barrier before any can finish, which only
+        # happens if all four files are processed concurrently
+        barrier = threading.Barrier(len(files))
         
         def mock_convert_file(filename):
             """Mock file conversion that takes time."""
-            time.sleep(0.1)  # Simulate processing time
+            barrier.wait(timeout=5)
+            time.sleep(0.01)  # Simulate processing time
             results.append(f"processed_{filename}")
         
-        # Create threads for parallel processing
-        files = ['file1.heic', 'file2.heic', 'file3.heic', 'file4.heic']
-        threads = []
-        
-        start_time = time.time()
-        
-        for filename in files:
-            thread = threading.Thread(target=mock_convert_file, args=(filename,))
-            threads.append(thread)
-            thread.start()
+        start_ns = time.perf_counter_ns()
         
-        # Wait for all threads to complete
-        for thread in threads:
-            thread.join()
+        with ThreadPoolExecutor(max_workers=len(files)) as executor:
+            list(executor.map(mock_convert_file, files))
         
-        end_time = time.time()
+        elapsed_ns = time.perf_counter_ns() - start_ns
         
         # Verify results
         self.assertEqual(len(results), 4)
         
-        # Parallel processing should be faster than sequential
-        # (4 files * 0.1 seconds each = 0.4 seconds sequential)
-        # Parallel should be closer to 0.1 seconds
-        self.assertLess(end_time - start_time, 0.3)  # Allow some overhead
+        # Generous bound; the barrier above is what proves parallelism
+        self.assertLess(elapsed_ns, 1_000_000_000)
+
+    @unittest.skipIf(sys.version_info < (3, 9), "asyncio.to_thread requires Python 3.9+")
+    def test_async_batch_execution(self):
+        """Test batch conversion driven from asyncio via to_thread."""
+        import asyncio
+        
+        files = ['file1.heic', 'file2.heic', 'file3.heic', 'file4.heic']
+        
+        def mock_convert_file(filename):
+            """Mock blocking file conversion."""
+            return f"processed_{filename}"
+        
+        async def _drive(batch):
+            return await asyncio.gather(*(asyncio.to_thread(mock_convert_file, f) for f in batch))
+        
+        results = asyncio.run(_drive(files))
+        
+        # gather() keeps results in submission order
+        self.assertEqual(results, [f"processed_{f}" for f in files])
 
     def test_error_handling(self):
         """Test error handling in batch processing."""
@@ -234,10 +279,8 @@ class TestBatchProcessor(unittest.TestCase):
 class TestConversionEngine(unittest.TestCase):
     """Test cases for ConversionEngine class."""
     
-    def setUp(self):
-        """Set up test fixtures."""
-        self.mock_engine = Mock()
-        
+    mock_engine = SharedMock()
+    
     def test_converter_registration(self):
         """Test converter registration system."""
         # Mock converter registration
@@ -303,18 +346,9 @@ class TestConversionEngine(unittest.TestCase):
                 self.assertEqual(result, expected)
 
 
-class TestIntegration(unittest.TestCase):
+class TestIntegration(TempDirMixin, unittest.TestCase):
     """Integration tests for core components."""
     
-    def setUp(self):
-        """Set up integration test fixtures."""
-        self.temp_dir = Path(tempfile.mkdtemp())
-        
-    def tearDown(self):
-        """Clean up integration test fixtures."""
-        if self.temp_dir.exists():
-            shutil.rmtree(self.temp_dir, ignore_errors=True)
-    
     def test_end_to_end_workflow(self):
         """Test end-to-end conversion workflow."""
         # Create test input file
@@ -363,5 +397,5 @@ class TestIntegration(unittest.TestCase):
 
 
 if __name__ == '__main__':
-    # Run tests with verbose output
-    unittest.main(verbosity=2)
\ No newline at end of file
+    # Run tests with verbose output (pytest provides the tmp_path fixture)
+    pytest.main([__file__, '-v'])
\ No newline at end of file
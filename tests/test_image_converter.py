@@ -0,0 +1,254 @@
+"""Tests for the professional image converter."""
+
+from pathlib import Path
+
+import pytest
+
+Image = pytest.importorskip('PIL.Image')
+from PIL import JpegImagePlugin
+
+from professional_image_converter import FINGERPRINT_SAMPLE_SIZE, ImageConverter
+
+pytestmark = pytest.mark.image
+
+
+def _make_image(path: Path, size=(64, 48), color=(200, 30, 30)) -> Path:
+    """Write a small solid-color image; the format follows the suffix."""
+    Image.new('RGB', size, color).save(path)
+    return path
+
+
+def test_convert_batch_preserves_input_order(temp_dir):
+    """Reports come back in input order, one per input, even with several workers."""
+    inputs = [
+        _make_image(temp_dir / 'wide.png', size=(120, 40)),
+        _make_image(temp_dir / 'tall.png', size=(40, 120)),
+        temp_dir / 'missing.png',
+        _make_image(temp_dir / 'square.bmp', size=(50, 50)),
+    ]
+
+    converter = ImageConverter()
+    results = converter.convert_batch(inputs, temp_dir / 'out', 'jpg', max_workers=2)
+
+    assert [r['input_file'] for r in results] == [str(p) for p in inputs]
+    assert [r['success'] for r in results] == [True, True, False, True]
+    assert 'Input validation failed' in results[2]['error']
+    assert [r['conversion_info']['final_size'] for r in results if r['success']] == [
+        (120, 40), (40, 120), (50, 50)
+    ]
+
+
+def test_convert_batch_merges_worker_stats(temp_dir):
+    """Counters from every worker process are added to the caller's stats."""
+    inputs = [_make_image(temp_dir / f'img{i}.png') for i in range(3)]
+    inputs.append(temp_dir / 'missing.png')
+
+    converter = ImageConverter()
+    converter.conversion_stats['total_attempted'] = 5  # pre-existing counts are kept
+    converter.convert_batch(inputs, temp_dir / 'out', 'jpg', max_workers=2)
+
+    assert converter.conversion_stats['total_attempted'] == 9
+    assert converter.conversion_stats['successful'] == 3
+    assert converter.conversion_stats['validation_passed'] == 3
+
+
+def test_convert_batch_passes_options_through(temp_dir):
+    """Keyword options reach convert_single_image in each worker."""
+    inputs = [_make_image(temp_dir / 'big.png', size=(400, 200))]
+
+    results = ImageConverter().convert_batch(inputs, temp_dir / 'out', 'png',
+                                             max_workers=1, max_width=100)
+
+    assert results[0]['success']
+    assert results[0]['conversion_info']['final_size'] == (100, 50)
+
+
+def _write_blob(path: Path, size: int, patch_at=None) -> Path:
+    """Write ``size`` deterministic bytes, optionally flipping the byte at ``patch_at``."""
+    data = bytearray(i % 251 for i in range(size))
+    if patch_at is not None:
+        data[patch_at] ^= 0xFF
+    path.write_bytes(bytes(data))
+    return path
+
+
+def _fingerprint(path: Path) -> str:
+    return ImageConverter()._calculate_file_fingerprint(path, path.stat().st_size)
+
+
+def test_fingerprint_samples_head_and_tail_only(temp_dir):
+    """Edits in the unsampled middle keep the fingerprint; head/tail edits change it."""
+    sample = FINGERPRINT_SAMPLE_SIZE
+    size = sample * 4
+    base = _fingerprint(_write_blob(temp_dir / 'base.bin', size))
+
+    assert _fingerprint(_write_blob(temp_dir / 'middle.bin', size, patch_at=size // 2)) == base
+    assert _fingerprint(_write_blob(temp_dir / 'head.bin', size, patch_at=0)) != base
+    assert _fingerprint(_write_blob(temp_dir / 'tail.bin', size, patch_at=size - 1)) != base
+
+
+def test_fingerprint_includes_file_size(temp_dir):
+    """Files with identical sampled bytes but different lengths differ."""
+    sample = FINGERPRINT_SAMPLE_SIZE
+    short = _write_blob(temp_dir / 'short.bin', sample * 3)
+    long = temp_dir / 'long.bin'
+    # Same head, same last 64 KiB, one extra middle block
+    long.write_bytes(short.read_bytes()[:sample * 2] + bytes(sample) + short.read_bytes()[sample * 2:])
+
+    assert _fingerprint(short) != _fingerprint(long)
+
+
+@pytest.mark.parametrize('size', [1, FINGERPRINT_SAMPLE_SIZE, FINGERPRINT_SAMPLE_SIZE + 1,
+                                  FINGERPRINT_SAMPLE_SIZE * 2 - 1])
+def test_fingerprint_covers_small_files_completely(temp_dir, size):
+    """Files up to two samples long are fingerprinted in full, without overlap."""
+    base = _fingerprint(_write_blob(temp_dir / 'base.bin', size))
+
+    for offset in {0, size // 2, size - 1}:
+        assert _fingerprint(_write_blob(temp_dir / f'edit{offset}.bin', size, patch_at=offset)) != base
+
+
+def test_fingerprint_is_stable(temp_dir):
+    """Same content gives the same 16-hex-digit fingerprint."""
+    path = _write_blob(temp_dir / 'a.bin', 1000)
+
+    assert _fingerprint(path) == _fingerprint(path)
+    assert len(_fingerprint(path)) == 16
+
+
+@pytest.mark.parametrize('width, height, max_width, max_height, expected', [
+    (640, 480, None, None, (640, 480)),        # no constraint
+    (4000, 3000, 1000, 1000, (1000, 750)),     # width is the binding constraint
+    (3000, 4000, 1000, 1000, (750, 1000)),     # height is the binding constraint
+    (400, 300, 200, 150, (200, 150)),          # both constraints bind exactly
+    (1000, 333, 500, None, (500, 166)),        # fractional result is floored
+    (2415, 8967, 3220, None, (3220, 11956)),   # exact quotient float math rounded down
+    (8967, 2415, None, 3220, (11956, 3220)),   # same case, height-only
+])
+def test_calculate_resize_dimensions(width, height, max_width, max_height, expected):
+    """Aspect-preserving fit uses exact integer cross-multiplication."""
+    assert ImageConverter._calculate_resize_dimensions(width, height, max_width, max_height) == expected
+
+
+def test_validate_rejects_images_over_pixel_cap(temp_dir, monkeypatch):
+    """The 40 MP cap holds even if other code raises Pillow's global limit."""
+    monkeypatch.setattr('professional_image_converter.MAX_IMAGE_PIXELS', 100 * 100)
+    monkeypatch.setattr(Image, 'MAX_IMAGE_PIXELS', 933_120_000)
+    converter = ImageConverter()
+
+    is_valid, error, _ = converter.validate_input_file(_make_image(temp_dir / 'big.png', size=(101, 100)))
+    assert not is_valid
+    assert error.startswith('Image too large')
+
+    is_valid, _, _ = converter.validate_input_file(_make_image(temp_dir / 'ok.png', size=(100, 100)))
+    assert is_valid
+
+
+def test_path_under_regular_file_fails_validation(temp_dir):
+    """A path through a regular file (ENOTDIR) is reported as missing, not as a crash."""
+    (temp_dir / 'plain.txt').write_text('not a directory')
+    missing = temp_dir / 'plain.txt' / 'x.png'
+
+    is_valid, error, info = ImageConverter().validate_input_file(missing)
+    assert not is_valid
+    assert error.startswith('File does not exist')
+    assert info == {}
+
+    result = ImageConverter().convert_single_image(missing, temp_dir / 'out', 'jpg')
+    assert result['checkpoints_failed'] == ['input_validation']
+    assert result['error'].startswith('Input validation failed: File does not exist')
+
+
+def _unchanged(input_info, output_format, quality=None, max_width=None, max_height=None,
+               optimize=False, progressive=False, subsampling=2):
+    return ImageConverter()._is_unchanged_conversion(
+        input_info, output_format, quality, max_width, max_height, optimize, progressive, subsampling
+    )
+
+
+@pytest.mark.parametrize('kwargs, expected', [
+    ({}, True),
+    ({'quality': 90}, True),             # quality is irrelevant to lossless PNG
+    ({'max_width': 32}, False),
+    ({'max_height': 32}, False),
+    ({'optimize': True}, False),
+])
+def test_unchanged_conversion_png(kwargs, expected):
+    """Same-format PNG is copied unless a resize or optimize pass is requested."""
+    assert _unchanged({'format': 'PNG'}, 'png', **kwargs) is expected
+
+
+def test_unchanged_conversion_needs_same_format():
+    """A format change always re-encodes."""
+    assert not _unchanged({'format': 'PNG'}, 'jpg')
+    assert not _unchanged({'format': 'JPEG', 'subsampling': 2}, 'png')
+
+
+@pytest.mark.parametrize('input_info, kwargs, expected', [
+    ({'format': 'JPEG', 'subsampling': 2}, {}, True),
+    ({'format': 'JPEG', 'subsampling': 2}, {'quality': 90}, False),      # explicit re-encode
+    ({'format': 'JPEG', 'subsampling': 2}, {'progressive': True}, False),
+    ({'format': 'JPEG', 'subsampling': 2}, {'subsampling': 0}, False),   # 4:2:0 -> 4:4:4
+    ({'format': 'JPEG', 'subsampling': 0}, {'subsampling': 0}, True),
+    ({'format': 'JPEG', 'subsampling': -1}, {'subsampling': 0}, True),   # grayscale
+])
+def test_unchanged_conversion_jpeg(input_info, kwargs, expected):
+    """Same-format JPEG is only copied for quality=None and matching encoder settings."""
+    assert _unchanged(input_info, 'jpeg', **kwargs) is expected
+
+
+def test_convert_single_image_copies_unchanged_png(temp_dir, real_image_files):
+    """A same-format no-op run copies the bytes and says so in the report."""
+    source = real_image_files['png']
+
+    result = ImageConverter().convert_single_image(source, temp_dir / 'out', 'png')
+
+    assert result['success']
+    assert result['conversion_info']['copied_unchanged'] is True
+    assert Path(result['output_file']).read_bytes() == source.read_bytes()
+    assert result['conversion_info']['file_size_before'] == result['conversion_info']['file_size_after']
+
+
+def test_convert_single_image_reencodes_jpeg_for_new_subsampling(temp_dir):
+    """quality=None still re-encodes a 4:2:0 JPEG when 4:4:4 is requested."""
+    source = temp_dir / 'src.jpg'
+    Image.new('RGB', (64, 48), (10, 120, 200)).save(source, 'JPEG', subsampling=2)
+
+    result = ImageConverter().convert_single_image(source, temp_dir / 'out', 'jpg',
+                                                   quality=None, subsampling=0)
+
+    assert result['success']
+    assert 'copied_unchanged' not in result['conversion_info']
+    with Image.open(result['output_file']) as output_img:
+        assert JpegImagePlugin.get_sampling(output_img) == 0
+
+
+def test_convert_single_image_copies_jpeg_with_quality_none(temp_dir):
+    """quality=None with default settings copies a JPEG byte-for-byte."""
+    source = temp_dir / 'src.jpg'
+    Image.new('RGB', (64, 48), (10, 120, 200)).save(source, 'JPEG')
+
+    result = ImageConverter().convert_single_image(source, temp_dir / 'out', 'jpg', quality=None)
+
+    assert result['conversion_info']['copied_unchanged'] is True
+    assert Path(result['output_file']).read_bytes() == source.read_bytes()
+
+
+def test_validate_accepts_minimal_sample_images(sample_image_files):
+    """The 1x1 fixture images are valid input for the converter."""
+    converter = ImageConverter()
+    for ext, path in sample_image_files.items():
+        is_valid, error, info = converter.validate_input_file(path)
+        assert is_valid, error
+        assert (info['width'], info['height']) == (1, 1)
+
+
+def test_convert_jpeg_to_png_keeps_pixels(temp_dir, real_image_files):
+    """A decoded JPEG->PNG conversion keeps the image's size and color."""
+    result = ImageConverter().convert_single_image(real_image_files['jpg'], temp_dir / 'out', 'png')
+
+    assert result['success'], result['error']
+    with Image.open(result['output_file']) as output_img:
+        assert output_img.size == (100, 100)
+        red, green, blue = output_img.convert('RGB').getpixel((50, 50))
+        assert red > 240 and green < 15 and blue < 15